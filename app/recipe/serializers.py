@@ -1,6 +1,8 @@
 """
 Serializers for recipe APIs
 """
+import copy
+
 from rest_framework import serializers
 
 from core.models import Recipe, Tag, Ingredient
@@ -37,6 +39,17 @@ class RecipeSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('id',)
 
+    # Keyed by class so subclasses such as RecipeDetailSerializer
+    # get their own entry.
+    _fields_cache = {}
+
+    def get_fields(self):
+        """Return fields built once per serializer class."""
+        cls = self.__class__
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        return copy.deepcopy(self._fields_cache[cls])
+
     def _get_or_create_tags(self, instance, tags):
         auth_user = self.context['request'].user
         for tag in tags:
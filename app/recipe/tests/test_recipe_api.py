@@ -22,8 +22,18 @@ from recipe.serializers import (
 )
 
 
+User = get_user_model()
+
 RECIPES_URL = reverse('recipe:recipe-list')
 
+RECIPE_DEFAULTS = {
+    'title': 'Sample recipe',
+    'time_minutes': 10,
+    'price': Decimal('5.00'),
+    'description': 'Sample description',
+    'link': 'https://sample.com/recipe',
+}
+
 
 def detail_url(recipe_id):
     """Return recipe detail URL."""
@@ -37,52 +47,54 @@ def image_upload_url(recipe_id):
 
 def create_recipe(user, **params):
     """Create and return a sample recipe."""
-    defaults = {
-        'title': 'Sample recipe',
-        'time_minutes': 10,
-        'price': Decimal('5.00'),
-        'description': 'Sample description',
-        'link': 'https://sample.com/recipe',
-    } | params
+    defaults = {**RECIPE_DEFAULTS, **params}
     return Recipe.objects.create(user=user, **defaults)
 
 
+def bulk_create_recipes(user, count=2, **params):
+    """Create and return sample recipes with a single insert."""
+    defaults = {**RECIPE_DEFAULTS, **params}
+    return Recipe.objects.bulk_create(
+        Recipe(user=user, **defaults) for _ in range(count)
+    )
+
+
 def create_user(**params):
     """Create and return a sample user."""
-    return get_user_model().objects.create_user(**params)
+    return User.objects.create_user(**params)
 
 
 class PublicRecipeApiTests(TestCase):
     """Test unauthenticated recipe API access."""
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_auth_required(self):
         """Test that authentication is required."""
-        response = self.client.get(reverse('recipe:recipe-list'))
+        response = self.client.get(RECIPES_URL)
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
 class PrivateRecipeApiTests(TestCase):
     """Test authenticated recipe API access."""
+    client_class = APIClient
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email='user@example.com', password='password123'
             )
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
     def test_retrieve_recipes(self):
         """Test retrieving a list of recipes."""
-        create_recipe(user=self.user)
-        create_recipe(user=self.user)
+        bulk_create_recipes(user=self.user, count=2)
 
         response = self.client.get(RECIPES_URL)
 
         recipes = Recipe.objects.all().order_by('-id')
-        self._extracted_from_test_recipe_list_limited(
+        self._assert_recipe_list(
             recipes, response
             )
 
@@ -96,15 +108,19 @@ class PrivateRecipeApiTests(TestCase):
 
         response = self.client.get(RECIPES_URL)
 
-        recipes = Recipe.objects.filter(user=self.user)
-        self._extracted_from_test_recipe_list_limited(
+        recipes = Recipe.objects.filter(user=self.user).order_by('-id')
+        self._assert_recipe_list(
             recipes, response
             )
 
-    def _extracted_from_test_recipe_list_limited(self, recipes, response):
-        serializer = RecipeSerializer(recipes, many=True)
+    def _assert_recipe_list(self, recipes, response):
+        """Assert the list response matches the given recipes."""
+        fields = ('id', 'title', 'time_minutes', 'link')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(
+            [{key: recipe[key] for key in fields} for recipe in response.data],
+            list(recipes.values(*fields)),
+        )
 
     def test_get_recipe_detail(self):
         """Test viewing a recipe detail."""
@@ -145,10 +161,8 @@ class PrivateRecipeApiTests(TestCase):
         res = self.client.patch(url, payload)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        recipe.refresh_from_db()
-        self.assertEqual(recipe.link, payload['link'])
-        self.assertEqual(recipe.title, recipe.title)
-        self.assertEqual(recipe.user, recipe.user)
+        self.assertEqual(res.data['link'], payload['link'])
+        self.assertEqual(res.data['title'], recipe.title)
 
     def test_full_update(self):
         """Test updating a recipe with put."""
@@ -168,9 +182,9 @@ class PrivateRecipeApiTests(TestCase):
         res = self.client.put(url, payload)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        recipe.refresh_from_db()
-        for key in payload:
-            self.assertEqual(payload[key], getattr(recipe, key))
+        self.assertEqual(Decimal(res.data['price']), payload['price'])
+        for key in ('title', 'time_minutes', 'description'):
+            self.assertEqual(res.data[key], payload[key])
 
     def test_update_user_returns_error(self):
         """Test updating user returns 403."""
@@ -219,14 +233,12 @@ class PrivateRecipeApiTests(TestCase):
             'tags': [{'name': 'Vegan'}, {'name': 'Dessert'}],
         }
 
-        recipe = self._extracted_from_test_create_with_tags(payload)
-# sourcery skip: no-loop-in-tests
+        recipe = self._create_recipe_with(payload, 'tags')
+        names = set(
+            recipe.tags.filter(user=self.user).values_list('name', flat=True)
+        )
         for tag in payload['tags']:
-            exists = recipe.tags.filter(
-                name=tag['name'],
-                user=self.user
-                ).exists()
-            self.assertTrue(exists)
+            self.assertIn(tag['name'], names)
 
     def test_create_recipe_with_existing_tags(self):
         """Test creating a recipe with existing tags."""
@@ -240,24 +252,24 @@ class PrivateRecipeApiTests(TestCase):
             'tags': [{'name': tag1.name}, {'name': 'Dessert'}],
         }
 
-        recipe = self._extracted_from_test_create_with_tags(payload)
+        recipe = self._create_recipe_with(payload, 'tags')
         self.assertIn(tag1, recipe.tags.all())
-# sourcery skip: no-loop-in-tests
+        names = set(
+            recipe.tags.filter(user=self.user).values_list('name', flat=True)
+        )
         for tag in payload['tags']:
-            exists = recipe.tags.filter(
-                name=tag['name'],
-                user=self.user
-                ).exists()
-            self.assertTrue(exists)
+            self.assertIn(tag['name'], names)
 
-    # TODO Rename this here and in
-    def _extracted_from_test_create_with_tags(self, payload=None):
+    def _create_recipe_with(self, payload, related):
+        """Create a recipe through the API and return it."""
         response = self.client.post(RECIPES_URL, payload, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         result = Recipe.objects.filter(user=self.user)
         self.assertEqual(result.count(), 1)
         result = result[0]
-        self.assertEqual(result.tags.count(), 2)
+        self.assertEqual(
+            getattr(result, related).count(), len(payload[related])
+        )
         return result
 
     def test_create_tag_on_update(self):
@@ -265,20 +277,25 @@ class PrivateRecipeApiTests(TestCase):
         recipe = create_recipe(user=self.user)
 
         payload = {'tags': [{'name': 'Dessert'}]}
-        self._extracted_from_test_clear_recipe_tags_6(recipe, payload)
+        self._patch_recipe(recipe, payload)
         new_tag = Tag.objects.get(user=self.user, name='Dessert')
         self.assertIn(new_tag, recipe.tags.all())
 
     def test_update_recipe_assign_tags(self):
         """Test updating a recipe assigns tags."""
-        tag1 = Tag.objects.create(user=self.user, name='Vegan')
-        tag2 = Tag.objects.create(user=self.user, name='Dessert')
+        tags = Tag.objects.bulk_create([
+            Tag(user=self.user, name='Vegan'),
+            Tag(user=self.user, name='Dessert'),
+        ])
         recipe = create_recipe(user=self.user)
 
-        payload = {'tags': [{'name': tag1.name}, {'name': tag2.name}]}
-        self._extracted_from_test_clear_recipe_tags_6(recipe, payload)
-        self.assertIn(tag1, recipe.tags.all())
-        self.assertIn(tag2, recipe.tags.all())
+        payload = {'tags': [{'name': tag.name} for tag in tags]}
+        self._patch_recipe(recipe, payload)
+        self.assertEqual(Tag.objects.filter(user=self.user).count(), 2)
+        self.assertCountEqual(
+            recipe.tags.values_list('name', flat=True),
+            [tag.name for tag in tags],
+        )
 
     def test_clear_recipe_tags(self):
         """Test clearing recipe tags."""
@@ -287,11 +304,11 @@ class PrivateRecipeApiTests(TestCase):
         recipe.tags.add(tag1)
 
         payload = {'tags': []}
-        self._extracted_from_test_clear_recipe_tags_6(recipe, payload)
+        self._patch_recipe(recipe, payload)
         self.assertEqual(recipe.tags.count(), 0)
 
-    # TODO Rename this here:
-    def _extracted_from_test_clear_recipe_tags_6(self, recipe, payload):
+    def _patch_recipe(self, recipe, payload):
+        """Patch a recipe through the API and check it succeeded."""
         url = detail_url(recipe.id)
         response = self.client.patch(url, payload, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -306,20 +323,14 @@ class PrivateRecipeApiTests(TestCase):
             'link': 'https://sample.com/recipe.pdf',
             'ingredients': [{'name': 'Flour'}, {'name': 'Sugar'}],
         }
-        res = self.client.post(RECIPES_URL, payload, format='json')
-
-        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipes.count(), 1)
-        recipe = recipes[0]
-        self.assertEqual(recipe.ingredients.count(), 2)
-# sourcery skip: no-loop-in-tests
-        for ingredient in payload['ingredients']:
-            exists = recipe.ingredients.filter(
-                name=ingredient['name'],
+        recipe = self._create_recipe_with(payload, 'ingredients')
+        names = set(
+            recipe.ingredients.filter(
                 user=self.user
-            ).exists()
-            self.assertTrue(exists)
+            ).values_list('name', flat=True)
+        )
+        for ingredient in payload['ingredients']:
+            self.assertIn(ingredient['name'], names)
 
     def test_create_recipe_with_existing_ingredients(self):
         """Test creating recipe with existing ingredients."""
@@ -332,30 +343,21 @@ class PrivateRecipeApiTests(TestCase):
             'link': 'https://sample.com/recipe.pdf',
             'ingredients': [{'name': ingredient1.name}, {'name': 'Sugar'}],
         }
-        res = self.client.post(RECIPES_URL, payload, format='json')
-
-        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        recipes = Recipe.objects.filter(user=self.user)
-        self.assertEqual(recipes.count(), 1)
-        recipe = recipes[0]
-        self.assertEqual(recipe.ingredients.count(), 2)
+        recipe = self._create_recipe_with(payload, 'ingredients')
         self.assertIn(ingredient1, recipe.ingredients.all())
-# sourcery skip: no-loop-in-tests
-        for ingredient in payload['ingredients']:
-            exists = recipe.ingredients.filter(
-                name=ingredient['name'],
+        names = set(
+            recipe.ingredients.filter(
                 user=self.user
-            ).exists()
-            self.assertTrue(exists)
+            ).values_list('name', flat=True)
+        )
+        for ingredient in payload['ingredients']:
+            self.assertIn(ingredient['name'], names)
 
     def test_create_ingredients_on_update(self):
         """Test updating a recipe assigns ingredients."""
         recipe = create_recipe(user=self.user)
         payload = {'ingredients': [{'name': 'Flour'}]}
-        url = detail_url(recipe.id)
-        response = self.client.patch(url, payload, format='json')
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self._patch_recipe(recipe, payload)
         new_ingredient = Ingredient.objects.get(user=self.user, name='Flour')
         self.assertIn(new_ingredient, recipe.ingredients.all())
 
@@ -367,10 +369,7 @@ class PrivateRecipeApiTests(TestCase):
 
         ingredient2 = Ingredient.objects.create(user=self.user, name='Sugar')
         payload = {'ingredients': [{'name': ingredient2.name}]}
-        url = detail_url(recipe.id)
-        response = self.client.patch(url, payload, format='json')
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self._patch_recipe(recipe, payload)
         self.assertIn(ingredient2, recipe.ingredients.all())
         self.assertNotIn(ingredient1, recipe.ingredients.all())
 
@@ -381,10 +380,7 @@ class PrivateRecipeApiTests(TestCase):
         recipe.ingredients.add(ingredient1)
 
         payload = {'ingredients': []}
-        url = detail_url(recipe.id)
-        response = self.client.patch(url, payload, format='json')
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self._patch_recipe(recipe, payload)
         self.assertEqual(recipe.ingredients.count(), 0)
 
     def test_filtering_recipes_by_tags(self):
@@ -430,10 +426,10 @@ class PrivateRecipeApiTests(TestCase):
 
 class ImageUploadTests(TestCase):
     """Test image upload."""
+    client_class = APIClient
 
     def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+        self.user = User.objects.create_user(
             'user@example.com', 'password123',
             )
         self.client.force_authenticate(self.user)
@@ -0,0 +1,42 @@
+"""
+Tests for recipe serializers.
+"""
+from django.test import SimpleTestCase
+
+from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
+
+
+class RecipeSerializerFieldsTests(SimpleTestCase):
+    """Test fields cached on the recipe serializers."""
+
+    def test_fields_not_shared_between_instances(self):
+        """Test each serializer gets its own bound field objects."""
+        serializer1 = RecipeDetailSerializer()
+        serializer2 = RecipeDetailSerializer()
+
+        for name, field in serializer1.fields.items():
+            other = serializer2.fields[name]
+            self.assertIsNot(field, other)
+            self.assertIs(field.parent, serializer1)
+            self.assertIs(other.parent, serializer2)
+
+        tags1 = serializer1.fields['tags']
+        tags2 = serializer2.fields['tags']
+        self.assertIsNot(tags1.child, tags2.child)
+        self.assertIs(tags1.child.parent, tags1)
+        self.assertIs(tags2.child.parent, tags2)
+
+    def test_field_changes_do_not_leak(self):
+        """Test changing one serializer's fields leaves others unchanged."""
+        serializer = RecipeDetailSerializer()
+        serializer.fields['title'].read_only = True
+        serializer.fields.pop('link')
+
+        other = RecipeDetailSerializer()
+        self.assertFalse(other.fields['title'].read_only)
+        self.assertIn('link', other.fields)
+
+    def test_fields_cached_per_class(self):
+        """Test subclasses build their own fields."""
+        self.assertNotIn('description', RecipeSerializer().fields)
+        self.assertIn('description', RecipeDetailSerializer().fields)
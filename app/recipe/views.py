@@ -58,6 +58,8 @@ class RecipeViewSet(viewsets.ModelViewSet):
 
         return queryset.filter(
             user=self.request.user
+            ).prefetch_related(
+                'tags', 'ingredients'
             ).order_by('-id').distinct()
 
     def get_serializer_class(self):